@@ -1,13 +1,7 @@
-import os
-
 from tprint import TPrint, TPrintColors, separator
 
 log_file = "tprint_demo_log.txt"
 
-# Ensure clean state
-if os.path.exists(log_file):
-    os.remove(log_file)
-
 colors = {
     'info': TPrintColors.WHITE,
     'warning': TPrintColors.YELLOW,
@@ -23,57 +17,59 @@ tprint = TPrint(
     debug_mode=True,
     log_file=log_file,
     use_timestamps=True,
-    purge_old_logs=True
+    purge_old_logs=True  # Start from an empty log file
 )
 
+# Sections 1, 3 and 8 batch their messages, so each reaches the terminal (and the log file) in a single write
 # Full style and message types
 separator("1. Initial Setup with Custom Color Scheme and All Flags Enabled")
-tprint.info("Informational message", log=True, style=TPrintColors.BOLD)
-tprint.warning("Warning message", log=True, style=TPrintColors.UNDERLINE)
-tprint.error("Error message", log=True, style=TPrintColors.REVERSED)
-tprint.success("Success achieved!", log=True, style=f"{TPrintColors.BOLD}{TPrintColors.UNDERLINE}")
-tprint.critical("System has crashed!", log=True, style=TPrintColors.BRIGHT_RED)
-tprint.debug("Debugging trace enabled!", log=True, style=TPrintColors.BOLD)
+with tprint.batch():
+    tprint.info("Informational message", log_to_file=True, style=TPrintColors.BOLD)
+    tprint.warning("Warning message", log_to_file=True, style=TPrintColors.UNDERLINE)
+    tprint.error("Error message", log_to_file=True, style=TPrintColors.REVERSED)
+    tprint.success("Success achieved!", log_to_file=True, style=f"{TPrintColors.BOLD}{TPrintColors.UNDERLINE}")
+    tprint.critical("System has crashed!", log_to_file=True, style=TPrintColors.BRIGHT_RED)
+    tprint.debug("Debugging trace enabled!", log_to_file=True, style=TPrintColors.BOLD)
 
 separator("2. Input Handling")
 name = tprint.input("Enter your name")
 tprint.info(f"Nice to meet you, {name}!", style=TPrintColors.BRIGHT_GREEN)
 
 separator("3. Toggling Timestamp and Debug Mode Off")
-tprint.set_timestamp_usage(False)
-tprint.set_debug_mode(False)
-
-tprint.info("This message has NO timestamp", log=True)
-tprint.debug("This debug message SHOULD NOT appear", log=True)
+with tprint.batch():
+    tprint.formatter(use_timestamps=False, debug_mode=False)
+    tprint.info("This message has NO timestamp", log_to_file=True)
+    tprint.debug("This debug message SHOULD NOT appear", log_to_file=True)
 
 separator("4. Resetting Log File and Logging OFF")
-tprint.set_log_file(None)
-tprint.info("This message won't be logged", log=False)
+tprint.close()  # Writes out buffered lines and closes the log file until a new one is set
+tprint.info("This message won't be logged", log_to_file=False)
 
 separator("5. Changing Color Scheme Dynamically")
-tprint.set_color_scheme({'info': TPrintColors.CYAN})
+tprint.formatter(color_scheme={'info': TPrintColors.CYAN})
 tprint.info("Color changed to cyan")
 
 separator("6. Manual Log Purging Check")
 # Should not purge old logs this time
-tprint.set_log_file(log_file)
-tprint.set_purge_old_logs(False)
-tprint.info("This message should append to existing log", log=True)
+tprint.formatter(log_file=log_file, purge_old_logs=False)
+tprint.info("This message should append to existing log", log_to_file=True)
 
 separator("7. Edge Case: Unknown Color Key (Should Raise Error)")
 try:
-    tprint.set_color_scheme({'nonexistent_level': TPrintColors.RED})
+    tprint.formatter(color_scheme={'nonexistent_level': TPrintColors.RED})
 except ValueError as e:
     tprint.error(f"Caught expected exception: {e}")
 
 separator("8. Mixed Styles and Complex Chaining")
-tprint.success("Styled success", style=f"{TPrintColors.UNDERLINE}{TPrintColors.BRIGHT_GREEN}")
-tprint.critical("Styled critical", style=f"{TPrintColors.REVERSED}{TPrintColors.BRIGHT_RED}")
+with tprint.batch():
+    tprint.success("Styled success", style=f"{TPrintColors.UNDERLINE}{TPrintColors.BRIGHT_GREEN}")
+    tprint.critical("Styled critical", style=f"{TPrintColors.REVERSED}{TPrintColors.BRIGHT_RED}")
 
 separator("9. Final Debug Enable")
-tprint.set_debug_mode(True)
+tprint.formatter(debug_mode=True)
 tprint.debug("Debugging is back!")
 
 separator("10. Log File Contents")
-with open(log_file, 'r') as f:
-    print(f"{TPrintColors.BRIGHT_BLACK}--- Log File Output ---\n{f.read()}{TPrintColors._RESET}")
+tprint.flush()  # Log lines are buffered, write them out before reading the file
+with open(log_file, 'r', encoding='utf-8') as f:
+    print(f"{TPrintColors.BRIGHT_BLACK}--- Log File Output ---\n{f.read()}{TPrintColors.RESET}")
@@ -1,6 +1,281 @@
 from __future__ import annotations
-import datetime
-from .colors import TPrintColors
+import contextlib
+import functools
+import os
+import queue
+import sys
+import threading
+import time
+import weakref
+from .colors import TPrintColors, _merge_sgr
+
+# Flags for opening log files, binary mode skips newline translation on Windows.
+_LOG_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0)
+
+# Maximum number of log buffers waiting for the background writer when async_log is enabled.
+_LOG_QUEUE_SIZE = 256
+
+# Reset sequence and newline closing every console line.
+_RESET_NL = f"{TPrintColors.RESET}\n"
+
+# Format of the timestamps prepended to messages.
+_TS_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Bound once so the per-message clock read skips the module attribute lookup.
+_time = time.time
+
+
+class _TimestampCache(threading.local):
+    """
+    Per-thread cache of the last formatted timestamp, so threads logging in different seconds
+    never overwrite each other's entry.
+    """
+    # Integer epoch second and the timestamp formatted for it
+    last = (0, '')
+
+
+_ts_cache = _TimestampCache()
+
+
+@functools.lru_cache(maxsize=128)
+def _styled_prefix(prefix: str, style: str) -> str:
+    """
+    Returns a console line prefix followed by the given style, fused into a single escape sequence.
+    """
+    return prefix + _merge_sgr(style)
+
+
+@functools.lru_cache(maxsize=16)
+def _separator_wrap(color: str) -> tuple[str, str]:
+    """
+    Returns the text printed before and after a separator title, with BOLD and the color
+    fused into a single escape sequence.
+    """
+    return f"{_merge_sgr(TPrintColors.BOLD, color)}--- ", f" ---{_RESET_NL}"
+
+
+def _write_all(fd: int, data: bytes):
+    """
+    Writes all of data to a file descriptor, continuing after partial writes.
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _now_ts() -> str:
+    """
+    Returns the current local time as 'YYYY-MM-DD HH:MM:SS', reformatting it at most once per second.
+    """
+    t = int(_time())
+    last = _ts_cache.last
+    if last[0] != t:
+        last = _ts_cache.last = (t, time.strftime(_TS_FORMAT, time.localtime(t)))
+    return last[1]
+
+
+class _LogFile:
+    """
+    The log file of a TPrint instance: its descriptor, the buffered lines and the optional background
+    writer thread. The emitters capture this object rather than the printer, so they form no reference
+    cycle with it, and the finalizer registered by TPrint can close the file as soon as the printer
+    is garbage collected.
+    """
+
+    __slots__ = (
+        'path', 'fd', 'size', 'buf', 'buffer_lines', 'max_bytes', 'drop_on_overflow',
+        'queue', 'thread', 'lock', 'write_lock', 'on_lost',
+    )
+
+    def __init__(self, buffer_lines: int, max_bytes: int | None, async_log: bool, drop_on_overflow: bool):
+        self.path = None
+        self.fd = None
+        # Bytes in the current log file, tracked locally so rotation never needs a stat per write
+        self.size = 0
+        self.buf = []
+        self.buffer_lines = buffer_lines
+        self.max_bytes = max_bytes
+        self.drop_on_overflow = drop_on_overflow
+        # With async_log, full log buffers go through a bounded queue drained by a lazily started thread
+        self.queue = queue.Queue(maxsize=_LOG_QUEUE_SIZE) if async_log else None
+        self.thread = None
+        # lock guards the line buffer, write_lock the descriptor. The writer thread only takes write_lock,
+        # so a caller holding lock while waiting for room in the queue never blocks it.
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        # Weak reference to the printer method called when a failed rotation leaves no log file open
+        self.on_lost = None
+
+    def add(self, line: str):
+        """
+        Buffers a line for the log file, the caller must check that logging is enabled.
+
+        Args:
+            line (str): The fully formatted log line, including its trailing newline.
+        """
+        with self.lock:
+            self.buf.append(line)
+            if len(self.buf) >= self.buffer_lines:
+                self.write_buffer()
+
+    def open(self, path: str | None, purge: bool):
+        """
+        Opens a persistent file descriptor for the given log file, then flushes and closes any previous one.
+        If the new file cannot be opened, the error is raised and the previous log file stays in use.
+
+        Args:
+            path (str | None): Path to the new log file, or None to only close the previous one.
+            purge (bool): Whether to clear the existing contents of the new log file.
+        """
+        fd = None
+        if path:
+            # Purging truncates old logs in the same open call
+            flags = _LOG_OPEN_FLAGS | os.O_TRUNC if purge else _LOG_OPEN_FLAGS
+            fd = os.open(path, flags, 0o644)
+            try:
+                size = os.fstat(fd).st_size
+            except OSError:
+                os.close(fd)
+                raise
+        if self.fd is not None:
+            self.flush()
+        with self.lock, self.write_lock:
+            if self.fd is not None:
+                os.close(self.fd)
+            self.fd = fd
+            self.path = path
+            if fd is not None:
+                self.size = size
+
+    def start_thread(self):
+        """
+        Starts the background thread that writes queued log buffers, the caller must hold the lock.
+        """
+        self.thread = threading.Thread(target=self.worker, name="TPrint-log", daemon=True)
+        self.thread.start()
+
+    def worker(self):
+        """
+        Drains the log queue, writing all buffers waiting in it to the log file in a single call,
+        until close() stops it.
+        """
+        log_queue = self.queue
+        while True:
+            chunks = [log_queue.get()]
+            while True:
+                try:
+                    chunks.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            # close() queues None to stop the thread once everything before it is written
+            stop = None in chunks
+            try:
+                with self.write_lock:
+                    if self.fd is not None:
+                        self.write_data(b''.join(chunk for chunk in chunks if chunk is not None))
+            except Exception as e:
+                # Keep draining the queue so flush() and close() never wait on a dead thread
+                sys.stderr.write(f"TPrint: failed to write to log file {self.path!r}: {e}\n")
+            finally:
+                for _ in chunks:
+                    log_queue.task_done()
+            if stop:
+                return
+
+    def write_buffer(self):
+        """
+        Writes the buffered log lines to the log file with a single system call, or with async_log
+        hands them to the background writer as one chunk. The caller must hold the lock.
+        """
+        data = ''.join(self.buf).encode('utf-8')
+        # Cleared first, so lines are never written twice after a failed write
+        self.buf.clear()
+        if self.queue is not None:
+            if self.thread is None:
+                self.start_thread()
+            try:
+                self.queue.put_nowait(data)
+            except queue.Full:
+                if not self.drop_on_overflow:
+                    # Wait for room rather than writing directly, which would reorder lines
+                    self.queue.put(data)
+            return
+        with self.write_lock:
+            # A failed rotation leaves no log file open
+            if self.fd is not None:
+                self.write_data(data)
+
+    def write_data(self, data: bytes):
+        """
+        Writes encoded log lines to the log file, rotating it once it reaches max_bytes.
+        The caller must hold write_lock.
+        """
+        _write_all(self.fd, data)
+        self.size += len(data)
+        if self.max_bytes is not None and self.size >= self.max_bytes:
+            self.rotate()
+
+    def rotate(self):
+        """
+        Renames the full log file to '<log_file>.1', replacing any older rotation, and starts a new one.
+        Renaming is a single metadata operation, no log data is copied.
+        Failures are reported once on stderr rather than raised to the code that logged the line.
+        """
+        if os.name == 'nt':
+            # Windows cannot rename a file that is still open
+            os.close(self.fd)
+            self.fd = None
+        try:
+            os.replace(self.path, f"{self.path}.1")
+        except OSError as e:
+            # Keep logging to the current path instead of retrying the rename on every write
+            sys.stderr.write(f"TPrint: failed to rotate log file {self.path!r}, rotation is turned off: {e}\n")
+            self.max_bytes = None
+        # Open the new file, or reopen the current path if the rename failed (recreating it if it was
+        # deleted), before closing the old descriptor so fd never holds a closed descriptor
+        try:
+            fd = os.open(self.path, _LOG_OPEN_FLAGS, 0o644)
+        except OSError as e:
+            sys.stderr.write(f"TPrint: failed to reopen log file {self.path!r}, file logging is turned off: {e}\n")
+            fd = None
+        if self.fd is not None:
+            os.close(self.fd)
+        self.fd = fd
+        self.size = 0
+        if fd is None:
+            self.path = None
+            on_lost = self.on_lost() if self.on_lost is not None else None
+            if on_lost is not None:
+                on_lost()
+
+    def flush(self):
+        """
+        Writes any buffered log lines to the log file.
+        With async_log, waits until the background thread has written every queued line.
+        """
+        with self.lock:
+            if self.fd is not None and self.buf:
+                self.write_buffer()
+        if self.thread is not None:
+            self.queue.join()
+
+    def close(self):
+        """
+        Flushes any buffered log lines, stops the writer thread and closes the log file.
+        The file is closed even if flushing fails.
+        """
+        try:
+            self.flush()
+        finally:
+            if self.thread is not None:
+                self.queue.put(None)
+                self.thread.join()
+                self.thread = None
+            with self.lock, self.write_lock:
+                if self.fd is not None:
+                    os.close(self.fd)
+                    self.fd = None
+                self.path = None
 
 
 # TPrint class handles the printing and logging mechanism with customizable color schemes.
@@ -12,12 +287,45 @@ class TPrint:
     can be logged to a file.
     """
 
+    __slots__ = (
+        'color_scheme', 'debug_mode', 'log_file', 'use_timestamps', 'purge_old_logs',
+        '_log', '_log_enabled', '_levels', '_input_prefix', '_emit', '_batch', '__weakref__',
+    )
+
+    # Colors used for every log level missing from a user-supplied color scheme
+    default_colors = {
+        'info': TPrintColors.WHITE,
+        'warning': TPrintColors.YELLOW,
+        'error': TPrintColors.RED,
+        'debug': TPrintColors.CYAN,
+        'input': TPrintColors.GREEN,
+        'critical': TPrintColors.RED,
+        'success': TPrintColors.GREEN
+    }
+
+    # Log levels that may appear as keys of a color scheme
+    _VALID_KEYS = frozenset(default_colors)
+
+    # Symbol printed in front of the messages of each log level
+    _SYMBOLS = {
+        'info': "*",
+        'warning': "!",
+        'error': "x",
+        'debug': "-",
+        'critical': "x",
+        'success': "✓",
+    }
+
     def __init__(self,
                  color_scheme: dict[str, str] = None,
                  debug_mode: bool = False,
                  log_file: str | None = None,
                  use_timestamps: bool = False,
                  purge_old_logs: bool = False,
+                 async_log: bool = False,
+                 drop_on_overflow: bool = False,
+                 log_buffer_lines: int = 64,
+                 max_log_bytes: int | None = None,
                  ):
         """
         Initializes the TPrint instance with optional custom color schemes and logging options.
@@ -27,165 +335,341 @@ class TPrint:
             debug_mode (bool): Flag to enable/disable debug mode (default: False).
             log_file (str): Path to the log file (default: None).
             use_timestamps (bool): Flag to enable/disable timestamp usage in logs (default: False).
-            purge_old_logs (bool): Flag to enable/disable old log purging (default: False).
-        """
-        self.default_colors = {
-            'info': TPrintColors.WHITE,
-            'warning': TPrintColors.YELLOW,
-            'error': TPrintColors.RED,
-            'debug': TPrintColors.CYAN,
-            'input': TPrintColors.GREEN,
-            'critical': TPrintColors.RED,
-            'success': TPrintColors.GREEN
-        }
-
+            purge_old_logs (bool): Flag to clear the existing contents of the log file when it is opened (default: False).
+            async_log (bool): Flag to write full log buffers from a background thread, which only helps
+                when disk writes stall (default: False).
+            drop_on_overflow (bool): Flag to drop full log buffers instead of waiting when the background
+                writer falls behind, only used with async_log (default: False).
+            log_buffer_lines (int): Number of log lines collected before they are written to the log file,
+                error and critical lines are written right away, or with async_log handed to the background
+                writer right away (default: 64).
+            max_log_bytes (int | None): Size at which the log file is renamed to '<log_file>.1' and a new one
+                is started, None never rotates. A failed rename is reported on stderr and turns
+                rotation off (default: None).
+        """
         # Validate the color_scheme dictionary
         if color_scheme is not None and isinstance(color_scheme, dict):
-            unknown_keys = set(color_scheme) - set(self.default_colors)
+            unknown_keys = color_scheme.keys() - TPrint._VALID_KEYS
             if unknown_keys:
                 raise ValueError(f"Unknown keys in color_scheme: {unknown_keys}")
+        if log_buffer_lines < 1:
+            raise ValueError(f"log_buffer_lines must be at least 1, got {log_buffer_lines}")
+        if max_log_bytes is not None and max_log_bytes < 1:
+            raise ValueError(f"max_log_bytes must be at least 1, got {max_log_bytes}")
 
         # Use user-supplied scheme or merge it with defaults
         self.color_scheme = {**self.default_colors, **(color_scheme or {})}
         self.debug_mode = debug_mode
-        self.log_file = log_file
+        self.log_file = None
         self.use_timestamps = use_timestamps
         self.purge_old_logs = purge_old_logs
 
-    @staticmethod
-    def __print_message(message, color: TPrintColors, symbol: str, timestamp: str = None, style=None):
+        # Log lines are buffered and written straight to a persistent file descriptor
+        self._log = _LogFile(log_buffer_lines, max_log_bytes, async_log, drop_on_overflow)
+        self._log_enabled = False
+        # Buffered log lines reach the file once the printer is garbage collected, or at interpreter exit
+        weakref.finalize(self, self._log.close)
+        self._log.on_lost = weakref.WeakMethod(self.__log_file_lost)
+        # Console lines collected by batch(), None outside of a batch
+        self._batch = None
+        self.__open_log_file(log_file)
+        self.__build_levels()
+        self.__build_emitter()
+
+    @property
+    def log_buffer_lines(self) -> int:
+        """
+        Number of log lines collected before they are written to the log file.
+        """
+        return self._log.buffer_lines
+
+    @log_buffer_lines.setter
+    def log_buffer_lines(self, value: int):
+        self._log.buffer_lines = value
+
+    @property
+    def max_log_bytes(self) -> int | None:
+        """
+        Size at which the log file is rotated, None never rotates.
         """
-        Prints the formatted message to the console with the specified color, symbol, and timestamp.
+        return self._log.max_bytes
+
+    @max_log_bytes.setter
+    def max_log_bytes(self, value: int | None):
+        self._log.max_bytes = value
+
+    @property
+    def drop_on_overflow(self) -> bool:
+        """
+        Whether full log buffers are dropped instead of waiting when the async_log writer falls behind.
+        """
+        return self._log.drop_on_overflow
+
+    @drop_on_overflow.setter
+    def drop_on_overflow(self, value: bool):
+        self._log.drop_on_overflow = value
+
+    def __open_log_file(self, log_file: str | None):
+        """
+        Opens the given log file, then flushes and closes any previous one.
+        If the new file cannot be opened, the error is raised and the previous log file stays in use.
 
         Args:
-            message (str): The message to print.
-            color (str): The ANSI escape code for the desired color.
-            symbol (str): A symbol representing the log level (e.g., "*", "!", "x").
-            timestamp (str): The timestamp to prepend to the message (default: None).
-            style (str): The text style to apply (default: None).
-        """
-        # Apply style (bold, underline, reversed) if provided
-        styled_message = f"{style}{message}" if style else message
-        # Print the formatted message with the correct color and timestamp
-        if timestamp:
-            print(f"{color}[{symbol}] [{timestamp}] {styled_message}{TPrintColors.RESET}")
+            log_file (str | None): Path to the new log file, or None to only close the previous one.
+        """
+        self._log.open(log_file, self.purge_old_logs)
+        self.log_file = log_file
+        self._log_enabled = self._log.fd is not None
+
+    def flush(self):
+        """
+        Writes any buffered log lines to the log file.
+        With async_log, waits until the background thread has written every queued line.
+        """
+        self._log.flush()
+
+    def close(self):
+        """
+        Flushes any buffered log lines, stops the async_log writer thread and closes the log file.
+        File logging stays off until formatter() sets a log file again.
+        """
+        try:
+            self._log.close()
+        finally:
+            self.__log_file_lost()
+
+    def __log_file_lost(self):
+        """
+        Turns file logging off after the log file was closed, or could not be reopened after a rotation.
+        """
+        self.log_file = None
+        self._log_enabled = False
+        # Switch to an emitter without the log file path
+        self.__build_emitter()
+
+    def __build_levels(self):
+        """
+        Precomputes the colored console prefix, the uncolored file prefix ('[symbol] ') and whether
+        log lines are written out immediately, for every log level from the current color scheme.
+        Also precomputes the colored input prompt prefix.
+        """
+        self._levels = {}
+        for level, symbol in TPrint._SYMBOLS.items():
+            # Errors and critical messages skip the log buffer so they survive a crash,
+            # with async_log they only reach the writer thread's queue without delay
+            write_now = level in ('error', 'critical')
+            self._levels[level] = (f"{self.color_scheme[level]}[{symbol}] ", f"[{symbol}] ", write_now)
+        self._input_prefix = f"{self.color_scheme['input']}[?] "
+
+    def __build_emitter(self):
+        """
+        Generates the function behind every log level. One of four straight-line variants is picked
+        once, by whether timestamps are used and whether a log file is open, with the level records
+        and output sink baked in. Called again whenever formatter() or close() changes the settings.
+        The closures capture the log file state but never the printer itself, and read log_buffer_lines
+        from it on every call since the attribute is public.
+        """
+        levels = self._levels
+        log = self._log
+        log_buf = log.buf
+        log_lock = log.lock
+        # Full buffers are written out, or with async_log handed to the background writer
+        write_log_buffer = log.write_buffer
+        # Console sink: the batch list, or None for whatever sys.stdout is at call time
+        write = self._batch.append if self._batch is not None else None
+
+        def emit_ts_file(level: str, message, args: tuple, log_to_file: bool = None, style: TPrintColors = None):
+            # Prints a timestamped message at the given log level and logs it to the file unless told not to
+            if args:
+                message = message % args
+            console_prefix, file_prefix, write_now = levels[level]
+            timestamp = f"[{_now_ts()}] "
+            # Apply style (bold, underline, reversed) if provided, fused into a single escape sequence
+            style = _merge_sgr(style) if style else ''
+            line = f"{console_prefix}{timestamp}{style}{message}{_RESET_NL}"
+            if write is None:
+                sys.stdout.write(line)
+            else:
+                write(line)
+            if log_to_file is None or log_to_file:
+                # Held across append and write so concurrent callers never lose or repeat lines
+                with log_lock:
+                    log_buf.append(f"{file_prefix}{timestamp}{message}\n")
+                    if write_now or len(log_buf) >= log.buffer_lines:
+                        write_log_buffer()
+
+        def emit_file(level: str, message, args: tuple, log_to_file: bool = None, style: TPrintColors = None):
+            # Prints a message at the given log level and logs it to the file unless told not to
+            if args:
+                message = message % args
+            console_prefix, file_prefix, write_now = levels[level]
+            # Without a timestamp the whole prefix is constant per (level, style) pair
+            console_prefix = _styled_prefix(console_prefix, style) if style else console_prefix
+            line = f"{console_prefix}{message}{_RESET_NL}"
+            if write is None:
+                sys.stdout.write(line)
+            else:
+                write(line)
+            if log_to_file is None or log_to_file:
+                with log_lock:
+                    log_buf.append(f"{file_prefix}{message}\n")
+                    if write_now or len(log_buf) >= log.buffer_lines:
+                        write_log_buffer()
+
+        def emit_ts(level: str, message, args: tuple, log_to_file: bool = None, style: TPrintColors = None):
+            # Prints a timestamped message at the given log level, no log file is open
+            if args:
+                message = message % args
+            timestamp = _now_ts()
+            style = _merge_sgr(style) if style else ''
+            line = f"{levels[level][0]}[{timestamp}] {style}{message}{_RESET_NL}"
+            if write is None:
+                sys.stdout.write(line)
+            else:
+                write(line)
+
+        def emit(level: str, message, args: tuple, log_to_file: bool = None, style: TPrintColors = None):
+            # Prints a message at the given log level, no log file is open
+            if args:
+                message = message % args
+            console_prefix = levels[level][0]
+            console_prefix = _styled_prefix(console_prefix, style) if style else console_prefix
+            if write is None:
+                sys.stdout.write(f"{console_prefix}{message}{_RESET_NL}")
+            else:
+                write(f"{console_prefix}{message}{_RESET_NL}")
+
+        if self._log_enabled:
+            self._emit = emit_ts_file if self.use_timestamps else emit_file
         else:
-            print(f"{color}[{symbol}] {styled_message}{TPrintColors.RESET}")
+            self._emit = emit_ts if self.use_timestamps else emit
 
-    def __log_message(self, message, symbol: str, timestamp=None):
+    def __write_batch(self):
+        """
+        Writes the console lines collected by batch() in a single call and empties the batch.
         """
-        Logs the message to a file if logging is enabled.
+        if self._batch:
+            text = ''.join(self._batch)
+            self._batch.clear()
+            sys.stdout.write(text)
 
-        Args:
-            message (str): The message to log.
-            symbol (str): The symbol representing the log level.
-            timestamp (str): The timestamp to prepend to the message (default: None).
-        """
-        # Optionally log messages to a file
-        if self.log_file:
-            with open(self.log_file, 'a', encoding='utf-8') as log:
-                if timestamp:
-                    log.write(f"[{symbol}] [{timestamp}] {message}\n")
-                else:
-                    log.write(f"[{symbol}] {message}\n")
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Collects the console lines printed inside the block and writes them all at once when it exits,
+        then flushes the log file. Nested batches join the outermost one.
+        Only lines from this printer's methods are collected, anything written to stdout another way,
+        e.g. separator() or print(), appears before the batched lines.
+
+        Example:
+            with tprint.batch():
+                tprint.info("First")
+                tprint.warning("Second")
+        """
+        if self._batch is not None:
+            yield self
+            return
+        self._batch = []
+        self.__build_emitter()
+        try:
+            yield self
+        finally:
+            # End the batch before writing, so a failed write (e.g. a broken pipe) cannot leave it open
+            lines = self._batch
+            self._batch = None
+            self.__build_emitter()
+            if lines:
+                sys.stdout.write(''.join(lines))
+            self.flush()
 
     # Log levels
-    def info(self, message, log_to_file: bool = None, style: TPrintColors = None):
+    def info(self, message, *args, log_to_file: bool = None, style: TPrintColors = None):
         """
         Logs an informational message.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, %-formatted with args if any are given.
+            *args: Values for the %-style placeholders in message, only formatted if the message is printed.
             log_to_file (bool): Whether to log the message to a file (default: None).
             style (str): The style to apply to the message (default: None).
         """
-        if log_to_file is None:
-            log_to_file = self.log_file
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S') if self.use_timestamps else None
-        self.__print_message(message, self.color_scheme['info'], "*", timestamp, style)
-        if log_to_file:
-            self.__log_message(message, "*", timestamp)
+        self._emit('info', message, args, log_to_file, style)
 
-    def warning(self, message, log_to_file: bool = None, style: TPrintColors = None):
+    def warning(self, message, *args, log_to_file: bool = None, style: TPrintColors = None):
         """
         Logs a warning message.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, %-formatted with args if any are given.
+            *args: Values for the %-style placeholders in message, only formatted if the message is printed.
             log_to_file (bool): Whether to log the message to a file (default: False).
             style (str): The style to apply to the message (default: None).
         """
-        if log_to_file is None:
-            log_to_file = self.log_file
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S') if self.use_timestamps else None
-        self.__print_message(message, self.color_scheme['warning'], "!", timestamp, style)
-        if log_to_file:
-            self.__log_message(message, "!", timestamp)
+        self._emit('warning', message, args, log_to_file, style)
 
-    def error(self, message, log_to_file: bool = None, style: TPrintColors = None):
+    def error(self, message, *args, log_to_file: bool = None, style: TPrintColors = None):
         """
         Logs an error message.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, %-formatted with args if any are given.
+            *args: Values for the %-style placeholders in message, only formatted if the message is printed.
             log_to_file (bool): Whether to log the message to a file (default: False).
             style (str): The style to apply to the message (default: None).
         """
-        if log_to_file is None:
-            log_to_file = self.log_file
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S') if self.use_timestamps else None
-        self.__print_message(message, self.color_scheme['error'], "x", timestamp, style)
-        if log_to_file:
-            self.__log_message(message, "x", timestamp)
+        self._emit('error', message, args, log_to_file, style)
 
-    def debug(self, message, log_to_file: bool = None, style: TPrintColors = None):
+    def debug(self, message, *args, log_to_file: bool = None, style: TPrintColors = None):
         """
-        Logs a debug message if debug mode is enabled.
+        Logs a debug message if debug mode is enabled, otherwise returns before doing any work.
+        Pass values as args to skip formatting while debug mode is off, e.g. tprint.debug("x=%s", x),
+        or guard messages that are expensive to build with is_debug_enabled():
+
+            if tprint.is_debug_enabled():
+                tprint.debug(f"State dump: {expensive_repr()}")
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, %-formatted with args if any are given.
+            *args: Values for the %-style placeholders in message, only formatted if the message is printed.
             log_to_file (bool): Whether to log the message to a file (default: False).
             style (str): The style to apply to the message (default: None).
         """
-        if log_to_file is None:
-            log_to_file = self.log_file
-        if self.debug_mode:  # Only print debug messages if debug mode is enabled
-            timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S') if self.use_timestamps else None
-            self.__print_message(message, self.color_scheme['debug'], "-", timestamp, style)
-            if log_to_file:
-                self.__log_message(message, "-", timestamp)
+        if not self.debug_mode:  # Only print debug messages if debug mode is enabled
+            return
+        self._emit('debug', message, args, log_to_file, style)
+
+    def is_debug_enabled(self) -> bool:
+        """
+        Checks whether debug messages are currently printed.
 
-    def critical(self, message, log_to_file: bool = None, style: TPrintColors = None):
+        Returns:
+            bool: True if debug mode is enabled.
+        """
+        return self.debug_mode
+
+    def critical(self, message, *args, log_to_file: bool = None, style: TPrintColors = None):
         """
         Logs a critical message.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, %-formatted with args if any are given.
+            *args: Values for the %-style placeholders in message, only formatted if the message is printed.
             log_to_file (bool): Whether to log the message to a file (default: False).
             style (str): The style to apply to the message (default: None).
         """
-        if log_to_file is None:
-            log_to_file = self.log_file
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S') if self.use_timestamps else None
-        self.__print_message(message, self.color_scheme['critical'], "x", timestamp, style)
-        if log_to_file:
-            self.__log_message(message, "x", timestamp)
+        self._emit('critical', message, args, log_to_file, style)
 
-    def success(self, message, log_to_file: bool = None, style: TPrintColors = None):
+    def success(self, message, *args, log_to_file: bool = None, style: TPrintColors = None):
         """
         Logs a success message.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, %-formatted with args if any are given.
+            *args: Values for the %-style placeholders in message, only formatted if the message is printed.
             log_to_file (bool): Whether to log the message to a file (default: False).
             style (str): The style to apply to the message (default: None).
         """
-        if log_to_file is None:
-            log_to_file = self.log_file
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S') if self.use_timestamps else None
-        self.__print_message(message, self.color_scheme['success'], "✓", timestamp, style)
-        if log_to_file:
-            self.__log_message(message, "✓", timestamp)
+        self._emit('success', message, args, log_to_file, style)
 
     def input(self, message, log_to_file: bool = None) -> str:
         """
@@ -198,14 +682,14 @@ class TPrint:
         Returns:
             str: The user's input.
         """
-        answer = input(f"{self.color_scheme['input']}[?] {message}")
-        if log_to_file is None:
-            log_to_file = self.log_file
-
-        if log_to_file:
-            timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S') if self.use_timestamps else None
-            self.__log_message(message, "?", timestamp)
-            self.__log_message(answer, ">", timestamp)
+        # Show anything batched so far before the prompt
+        self.__write_batch()
+        answer = input(f"{self._input_prefix}{message}")
+        do_log = self._log_enabled if log_to_file is None else bool(log_to_file) and self._log_enabled
+        if do_log:
+            timestamp = f" [{_now_ts()}]" if self.use_timestamps else ""
+            self._log.add(f"[?]{timestamp} {message}\n")
+            self._log.add(f"[>]{timestamp} {answer}\n")
 
         return answer
 
@@ -230,15 +714,20 @@ class TPrint:
         """
         # Allows for dynamic color updates
         if color_scheme:
-            self.color_scheme.update(color_scheme)
-            unknown_keys = set(color_scheme) - set(self.default_colors)
+            # Validate before updating so a rejected scheme leaves the current one untouched
+            unknown_keys = color_scheme.keys() - TPrint._VALID_KEYS
             if unknown_keys:
                 raise ValueError(f"Unknown keys in color_scheme: {unknown_keys}")
+            self.color_scheme.update(color_scheme)
+            self.__build_levels()
 
         self.use_timestamps = use_timestamps if use_timestamps is not None else self.use_timestamps
-        self.log_file = log_file if log_file is not None else self.log_file
+        # Update the purge flag first so it applies to a newly set log file
         self.purge_old_logs = purge_old_logs if purge_old_logs is not None else self.purge_old_logs
+        if log_file is not None and log_file != self.log_file:
+            self.__open_log_file(log_file)
         self.debug_mode = debug_mode if debug_mode is not None else self.debug_mode
+        self.__build_emitter()
 
 
 def separator(title, color: TPrintColors = TPrintColors.MAGENTA):
@@ -249,4 +738,5 @@ def separator(title, color: TPrintColors = TPrintColors.MAGENTA):
         title (str): The title to display in the separator.
         color (TPrintColors): The color to use - defaults to magenta.
     """
-    print(f"{TPrintColors.BOLD}{color}--- {title} ---{TPrintColors.RESET}")
+    prefix, suffix = _separator_wrap(color)
+    sys.stdout.write(f"{prefix}{title}{suffix}")
@@ -1,3 +1,11 @@
+import functools
+import re
+
+# Matches a string made only of SGR escape sequences, e.g. '\033[1m\033[4m'.
+_SGR_RUN = re.compile(r'(?:\033\[[0-9;]*m)+')
+_SGR_PARAMS = re.compile(r'\033\[([0-9;]*)m')
+
+
 # TPrintColors contains the ANSI color codes and additional highlights for text styling.
 class TPrintColors:
     """
@@ -38,3 +46,22 @@ class TPrintColors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
     REVERSED = '\033[7m'
+
+
+@functools.lru_cache(maxsize=128)
+def _merge_sgr(*codes: str) -> str:
+    """
+    Fuses consecutive SGR escape sequences into a single one, e.g. BOLD + UNDERLINE becomes '\033[1;4m'.
+
+    Args:
+        *codes (str): The escape sequences to merge, each may itself contain several sequences.
+
+    Returns:
+        str: One escape sequence carrying every parameter, or the plain concatenation if any
+        code is not a pure SGR sequence.
+    """
+    joined = ''.join(codes)
+    if not _SGR_RUN.fullmatch(joined):
+        return joined
+    params = [param or '0' for param in _SGR_PARAMS.findall(joined)]
+    return f"\033[{';'.join(params)}m"